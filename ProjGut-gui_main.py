@@ -22,7 +22,10 @@ The GUI enables users to:
 Available GUI components and utilities
 --------------------------------------
 - :func:`log_progress`  
-    Append status messages to the GUI's progress log.
+    Queue status messages for the GUI's progress log.
+
+- :func:`flush_log`  
+    Write queued progress messages to the log in a single update.
 
 - :func:`_center_window_over_master`  
     Position modal dialogs relative to the parent window.
@@ -36,6 +39,9 @@ Available GUI components and utilities
 - :func:`ask_green_integer`  
     Prompt the user for integer input with validation.
 
+- :func:`ask_green_authors`  
+    Prompt for all author names at once via a single themed dialog.
+
 - :func:`get_requested_gutenberg_id`  
     Determine the Gutenberg ID based on manual entry or dropdown selection.
 
@@ -45,8 +51,8 @@ Available GUI components and utilities
 - :class:`CustomButton`  
     Styled button class with hover effects and custom colors.
 
-- :func:`refresh_dropdown`  
-    Reload and repopulate the book-selection combobox using the database.
+- :func:`add_book_to_dropdown`  
+    Add a newly stored book to the in-memory book-selection list.
 
 - :func:`show_top10_from_db`  
     Display stored top-frequency results for a selected book.
@@ -54,10 +60,17 @@ Available GUI components and utilities
 - :func:`clear_fields`  
     Reset all entry fields, results, and progress logs.
 
+- :func:`_wait_for_future`  
+    Wait on background fetch/parse work without freezing the GUI.
+
 - :func:`close_window`  
     Terminate the application cleanly.
 
 - :func:`click`  
+    SUBMIT handler: ignores presses while a submission is in progress and
+    runs :func:`_submit_workflow`.
+
+- :func:`_submit_workflow`  
     Main controller for the SUBMIT workflow: fetch text, collect author
     metadata, compute word frequencies, store results, and update the GUI.
 
@@ -77,51 +90,70 @@ CSM CIS 117 Final Project
 Date: November–December 2025
 """
 
-import sqlite3
 import webbrowser
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Event
 from tkinter import *
 from tkinter.ttk import Combobox, Style
 from helpers_text import (
     make_gutenberg_link,
-    fetch_gutenberg_text,
+    feed_gutenberg_text,
     extract_title,
     extract_author_block,
     load_stopwords,
-    MyHTMLParser
+    WordCounter
 )
 from helpers_db import (
-    DB_PATH,
-    ensure_tables_exist,
+    get_connection,
+    close_connection,
     get_or_create_author,
     lookup_book_and_freqs,
     load_book_list_from_db,
+    format_book_label,
     insert_book,
     insert_book_author_links,
     get_book_title,
-    get_book_authors,
+    get_book_author_names,
     store_word_frequencies
 )
 
-# -------------------------------------------
-# function that reports progress log messages
-# -------------------------------------------
+# --------------------------------------------
+# functions that report progress log messages
+# --------------------------------------------
+
+# Pending progress messages, written to the widget in one insert per phase
+_log_buf = []
 
 def log_progress(msg):
     """
-    Append a message to the GUI progress log and scroll to the end.
+    Queue a message for the GUI progress log.
+
+    Messages are buffered and only written to the widget by
+    :func:`flush_log`, so a burst of messages costs a single Tk redraw.
 
     Parameters
     ----------
     msg : str
         Text to append to the progress log widget.
+    """
+    _log_buf.append(msg)
+
+def flush_log():
+    """
+    Write all queued progress messages to the log and scroll to the end.
 
     Side effects
     ------------
-    - Inserts text into the global `progress_output` widget.
-    - Scrolls to the most recent line.
+    - Inserts the buffered text into the global `progress_output` widget
+      with a single insert and clears the buffer.
+    - Scrolls to the most recent line and lets Tk redraw the widget.
     """
-    progress_output.insert(END, msg)
+    if not _log_buf:
+        return
+    progress_output.insert(END, "".join(_log_buf))
+    _log_buf.clear()
     progress_output.see(END)
+    progress_output.update_idletasks()
 
 # --------------------------------
 # GUI helper dialogs (green theme)
@@ -169,7 +201,8 @@ class _GreenBaseDialog(Toplevel):
     Notes
     -----
     This class is not intended for direct instantiation. Helper functions
-    such as :func:`ask_green_string` and :func:`ask_green_integer` build on it.
+    such as :func:`ask_green_string`, :func:`ask_green_integer` and
+    :func:`ask_green_authors` build on it.
     """
     def __init__(self, master, title):
         super().__init__(master)
@@ -330,6 +363,93 @@ def ask_green_integer(master, title, prompt, initial=None, minvalue=None, maxval
     dlg.wait_window()
     return dlg.result
 
+def ask_green_authors(master, n, title="Authors"):
+    """
+    Present one themed modal dialog collecting names for ``n`` authors.
+
+    Each author gets a row with a FIRST & MIDDLE names field (optional) and a
+    LAST name field (required), so all authors are entered in one round trip
+    instead of two dialogs per author.
+
+    Parameters
+    ----------
+    master : tkinter.Widget
+        Parent window for the dialog.
+    n : int
+        Number of author rows to display.
+    title : str, optional
+        Dialog title.
+
+    Returns
+    -------
+    list of (str, str) or None
+        ``(first, last)`` pairs of trimmed input in author order (``first``
+        may be ``""``), or ``None`` if the dialog is canceled.
+
+    Notes
+    -----
+    Validation runs over all rows at once when OK is pressed; the first row
+    with a blank last name is reported and receives focus.
+    """
+    dlg = _GreenBaseDialog(master, title)
+    Label(dlg, text="Enter each author's names.\nEnter 'none' as first name for single-name authors.",
+          bg="#C9F2CE", fg="#1F6B2D",
+          font=("Arial", 12, "bold")).pack(padx=18, pady=(12,6))
+
+    grid = Frame(dlg, bg="#C9F2CE")
+    grid.pack(padx=18, pady=(0,10))
+    Label(grid, text="FIRST & MIDDLE names (optional)", bg="#C9F2CE", fg="#1F6B2D",
+          font=("Arial", 10, "bold")).grid(row=0, column=1, padx=4, sticky=W)
+    Label(grid, text="LAST name", bg="#C9F2CE", fg="#1F6B2D",
+          font=("Arial", 10, "bold")).grid(row=0, column=2, padx=4, sticky=W)
+
+    rows = []
+    for i in range(1, n + 1):
+        Label(grid, text=f"Author {i}", bg="#C9F2CE", fg="#1F6B2D",
+              font=("Arial", 12)).grid(row=i, column=0, padx=4, pady=2, sticky=W)
+        first_var, last_var = StringVar(), StringVar()
+        first_entry = Entry(grid, textvariable=first_var, bg="#E9FCDE", fg="#0F4D21",
+                            font=("Arial", 12))
+        first_entry.grid(row=i, column=1, padx=4, pady=2)
+        if i == 1:
+            first_entry.focus_set()
+        last_entry = Entry(grid, textvariable=last_var, bg="#E9FCDE", fg="#0F4D21",
+                           font=("Arial", 12))
+        last_entry.grid(row=i, column=2, padx=4, pady=2)
+        rows.append((first_var, last_var, last_entry))
+
+    status = Label(dlg, text="", bg="#C9F2CE", fg="#AA0000", font=("Arial", 10))
+    status.pack(padx=18, pady=(0,2))
+
+    def on_ok(event=None):
+        result = []
+        for i, (first_var, last_var, last_entry) in enumerate(rows, start=1):
+            last = last_var.get().strip()
+            if last == "":
+                status.config(text=f"Please enter a last name for Author {i} or press Cancel.")
+                last_entry.focus_set()
+                return
+            result.append((first_var.get().strip(), last))
+        dlg.result = result
+        dlg.destroy()
+
+    def on_cancel(event=None):
+        dlg.result = None
+        dlg.destroy()
+
+    btn_frame = Label(dlg, bg="#C9F2CE")
+    btn_frame.pack(pady=(6,12))
+    Button(btn_frame, text="OK", bg="#8FFFA0", fg="#0F4D21", width=8, command=on_ok).pack(side="left", padx=6)
+    Button(btn_frame, text="Cancel", bg="#F0F0F0", fg="#0F4D21", width=8, command=on_cancel).pack(side="left", padx=6)
+
+    dlg.bind("<Return>", on_ok)
+    dlg.bind("<Escape>", on_cancel)
+
+    dlg.grab_set()
+    _center_window_over_master(dlg, master)
+    dlg.wait_window()
+    return dlg.result
+
 # -----------------------------------------
 # GUI main (window & layout initialization)
 # -----------------------------------------
@@ -362,9 +482,26 @@ window.option_add("*TCombobox*Listbox.selectForeground", "#0F4D21")
 # GUI state variables initialization
 # -----------------------------------------
 book_choice = None
-id_map = {}
+id_list = []   # projGutIDs aligned with the dropdown values
 gutenberg_id_var = StringVar()
 
+# Stopwords are static for the session; load them once rather than per SUBMIT
+STOPWORDS = load_stopwords()
+
+# Worker threads for the network fetch and text parsing so the GUI stays live
+EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+# Guard against overlapping SUBMITs (see click())
+submit_in_progress = False
+SUBMIT_DEBOUNCE_MS = 200
+
+# Set when the window is closed; stops suspended submissions (each submission
+# stops its own download through a per-submission cancel event)
+CLOSING = Event()
+
+class SubmissionCancelled(Exception):
+    """Raised inside a suspended submission when the window is closed."""
+
 # --------------------------------------------------------
 # GUI utilities
 # --------------------------------------------------------
@@ -397,13 +534,10 @@ def get_requested_gutenberg_id():
     selection = book_choice.get().strip()
     if selection == "__ select a book __" or not selection:
         return None, "Please choose a book or enter a Project Gutenberg book ID."
-    gutID = id_map.get(selection)
-    if gutID is None:
+    idx = dropdown.current()
+    if idx < 0:
         return None, "Selection not recognized."
-    try:
-        return int(str(gutID).lower().replace("pg", "")), None
-    except Exception:
-        return None, "Invalid Project Gutenberg book ID."
+    return id_list[idx], None
 
 
 # GUI utilities: linkout function
@@ -458,20 +592,34 @@ class CustomButton(Button):
 
 # GUI utilities: DB access to provide data to GUI
 
-def refresh_dropdown():
+def add_book_to_dropdown(gutID_int, title, authors):
     """
-    Reload the book list from the database and update the dropdown widget.
+    Add a newly stored book to the dropdown without re-reading the database.
+
+    The book list is loaded from the database once at startup; afterwards it
+    is maintained in memory and only the new entry is appended.
+
+    Parameters
+    ----------
+    gutID_int : int
+        Project Gutenberg numeric identifier.
+    title : str
+        Title of the book as stored in the database.
+    authors : list of (str or None, str)
+        ``(first, last)`` tuples in author order.
 
     Side effects
     ------------
-    - Replaces the combobox `values` list with fresh database entries.
-    - Updates the global ``id_map`` used for ID lookup.
+    - Appends the book's label and ID to the global ``book_list`` /
+      ``id_list`` pair and the combobox `values` (unless it is already
+      listed).
     - Resets the displayed selection to ``"__ select a book __"``.
     """
-    global dropdown, book_choice, id_map
-    new_book_list, new_id_map = load_book_list_from_db()
-    id_map = new_id_map
-    dropdown['values'] = new_book_list
+    label = format_book_label(title, authors)
+    if gutID_int not in id_list:
+        book_list.append(label)
+        id_list.append(gutID_int)
+        dropdown['values'] = book_list
     book_choice.set("__ select a book __")
 
 def show_top10_from_db(freq_rows, gutID_int):
@@ -481,7 +629,8 @@ def show_top10_from_db(freq_rows, gutID_int):
     Parameters
     ----------
     freq_rows : iterable of (str, int)
-        Word-frequency pairs retrieved from the database.
+        Top word-frequency pairs, already in descending count order (as
+        returned by :func:`lookup_book_and_freqs`).
     gutID_int : int
         Project Gutenberg numeric identifier.
 
@@ -494,45 +643,109 @@ def show_top10_from_db(freq_rows, gutID_int):
     words_output.delete("1.0", END)
 
     try:
-        con = sqlite3.connect(DB_PATH)
-        cur = con.cursor()
+        cur = get_connection().cursor()
 
-        # Retrieve title and authors using helper functions
+        # Retrieve title and display-ready author names using helper functions
         title = get_book_title(cur, gutID_int)
-        authors = get_book_authors(cur, gutID_int)
-
-        con.close()
+        author_names = get_book_author_names(cur, gutID_int)
 
     except Exception as e:
         words_output.insert(END, f"(Error fetching author/title: {e})\n\n")
         return
 
     # ----- Format authors -----
-    if not authors:
-        author_str = "Unknown Author"
-    else:
-        formatted = []
-        for first, last in authors:
-            if not first or first.strip().lower() in ("", "none", "null"):
-                formatted.append(last)
-            else:
-                formatted.append(f"{first} {last}")
-        author_str = ", ".join(formatted)
+    author_str = ", ".join(author_names) if author_names else "Unknown Author"
 
     display_title = title or f"Book {gutID_int}"
 
     words_output.insert(END, f"\n{display_title}\n\nby {author_str}\n\n")
 
     # ----- Print Top 10 Words -----
-    sorted_rows = sorted(freq_rows, key=lambda x: x[1], reverse=True)
-
     words_output.insert(END, f"  {'Word frequency':>1}  {'Word':<20} \n")
     words_output.insert(END, f"  {'______________':>1}  {'______________':<20} \n")
 
-    for word, count in sorted_rows[:10]:
+    for word, count in freq_rows:
         words_output.insert(END, f"{count:>16}  {word:<20} \n")
 
 
+# GUI utilities: background work (fetch & parse off the Tk main thread)
+
+def _fetch_and_parse(url, header_future, cancel):
+    """
+    Stream an ebook into a fresh parser, publishing its header early.
+
+    Runs on an :data:`EXECUTOR` worker thread and touches no widgets. The
+    header text is delivered through ``header_future`` as soon as it has
+    arrived, so the GUI can show metadata and prompt for authors while the
+    rest of the book is still downloading and being tokenized.
+
+    Parameters
+    ----------
+    url : str
+        Direct URL to a Gutenberg ``.txt`` file.
+    header_future : concurrent.futures.Future
+        Resolved with the header text, or with ``None`` if the download
+        failed before the header was complete.
+    cancel : threading.Event
+        Set by the submitting workflow when it no longer needs the result;
+        the download then stops at the next chunk.
+
+    Returns
+    -------
+    tuple
+        ``(parser, error_message)`` where ``parser`` holds the accumulated
+        word counts and ``error_message`` is ``None`` on success.
+    """
+    parser = WordCounter(STOPWORDS)
+    try:
+        _, err = feed_gutenberg_text(url, parser, on_header=header_future.set_result,
+                                     cancel=cancel)
+    finally:
+        if not header_future.done():
+            header_future.set_result(None)
+    return parser, err
+
+def _wait_for_future(fut, poll_ms=50):
+    """
+    Wait for a background future while keeping the Tk event loop running.
+
+    The future is polled with ``window.after`` and the caller is suspended with
+    ``wait_variable``, in the same way the modal dialogs use ``wait_window``.
+    Windows keep redrawing and the progress log keeps scrolling meanwhile.
+
+    Parameters
+    ----------
+    fut : concurrent.futures.Future
+        Future returned by ``EXECUTOR.submit``.
+    poll_ms : int, optional
+        Polling interval in milliseconds. Default is 50.
+
+    Returns
+    -------
+    object
+        The future's result (exceptions raised by the worker propagate).
+
+    Raises
+    ------
+    SubmissionCancelled
+        If the window is closed while waiting.
+    """
+    done = BooleanVar(value=False)
+
+    def _check():
+        if fut.done() or CLOSING.is_set():
+            done.set(True)
+        else:
+            window.after(poll_ms, _check)
+
+    _check()
+    if not done.get():
+        window.wait_variable(done)
+    if CLOSING.is_set():
+        raise SubmissionCancelled()
+    return fut.result()
+
+
 # GUI utilities: reset & cleanup helpers
 
 def clear_fields():
@@ -554,10 +767,27 @@ def close_window():
     """
     Close the GUI application gracefully.
 
+    If a submission is suspended (in a dialog or waiting for the download),
+    the window is hidden and the submission is cancelled instead; it unwinds
+    and :func:`click` then finishes the shutdown, so the workflow never
+    resumes on a destroyed window or a closed connection.
+
     Side effects
     ------------
-    Stops the Tkinter event loop and destroys the main window.
+    Closes the shared database connection, stops the Tkinter event loop and
+    destroys the main window. Background downloads have already been told
+    to stop by the submissions that started them.
     """
+    CLOSING.set()
+    if submit_in_progress:
+        window.withdraw()
+        for child in window.winfo_children():
+            if isinstance(child, Toplevel):
+                child.destroy()   # open dialogs return as if cancelled
+        return
+
+    EXECUTOR.shutdown(wait=False, cancel_futures=True)
+    close_connection()
     window.quit()      # Stops the Tkinter mainloop
     window.destroy()   # Closes the window completely
 
@@ -566,30 +796,74 @@ def close_window():
 # ---------------------------------
 def click():
     """
-    Primary controller for the SUBMIT button workflow.
+    Handle the SUBMIT button / Enter key, ignoring presses while busy.
+
+    Runs :func:`_submit_workflow` unless a submission is already in progress
+    (its dialogs and background waits keep the event loop running, so a
+    second press could otherwise start an overlapping fetch and parse). The
+    SUBMIT button is disabled while work is pending and re-enabled shortly
+    after it finishes, so a rapid double-tap of Enter is coalesced.
+    """
+    global submit_in_progress
+    if submit_in_progress:
+        return
+    submit_in_progress = True
+    submit_button.config(state=DISABLED)
+    try:
+        _submit_workflow()
+    except SubmissionCancelled:
+        pass
+    finally:
+        if CLOSING.is_set():
+            # the window was closed during the submission (see close_window())
+            submit_in_progress = False
+            close_window()
+        else:
+            window.after(SUBMIT_DEBOUNCE_MS, _end_submission)
+
+def _end_submission():
+    """
+    Mark the current submission as finished.
+
+    Side effects
+    ------------
+    - Clears the global ``submit_in_progress`` flag.
+    - Re-enables the SUBMIT button, or finishes closing the window if it was
+      closed during the debounce delay.
+    """
+    global submit_in_progress
+    submit_in_progress = False
+    if CLOSING.is_set():
+        close_window()
+    else:
+        submit_button.config(state=NORMAL)
+
+def _submit_workflow():
+    """
+    Primary controller for the SUBMIT button workflow (called by :func:`click`).
 
     Workflow
     --------
     1. Determine the target Project Gutenberg ID.
-    2. Connect to SQLite and ensure required tables exist.
+    2. Obtain a cursor on the shared SQLite connection.
     3. If stored frequencies exist, display them immediately.
     4. Otherwise:
-        - Fetch ebook text
+        - Stream ebook text into the parser in the background
         - Extract and log metadata
-        - Insert or update the book record
         - Prompt the user for author information
-        - Create or fetch author records
-        - Link authors to the book
-        - Parse text and compute word frequencies
-        - Store the top 10 results in the database
+        - Compute word frequencies from the parsed text
+        - In a single transaction: insert the book record, create or fetch
+          author records, link authors to the book, and store the top 10
+          results
     5. Display the final results and refresh GUI state.
 
     Side effects
     ------------
     - Writes detailed progress information to the `progress_output` widget.
     - Writes formatted frequency results to the `words_output` widget.
-    - Performs multiple database writes through helper functions.
-    - Interacts with HTML parsing and stopword loading subsystems.
+    - Performs all database writes for a new book through helper functions
+      inside one transaction.
+    - Interacts with the word-counting subsystem and the cached stopword set.
     """
     # Reset user-visible text areas
     progress_output.delete("1.0", END)
@@ -599,21 +873,28 @@ def click():
     gutID_int, err = get_requested_gutenberg_id()
     if err:
         log_progress(err + "\n")
+        flush_log()
         return
 
     log_progress(f"Processing Project Gutenberg ID: {gutID_int}\n\n")
 
-    # Connect to the database
+    # Reuse the shared helpers_db connection; it is opened (tuned and
+    # schema-checked) on first use, so database problems are reported here
+    # rather than preventing the window from opening
     try:
-        con = sqlite3.connect(DB_PATH)
+        con = get_connection()
         cur = con.cursor()
-        ensure_tables_exist(con)
-        log_progress("Database tables verified or created.\n\n")
 
     except Exception as e:
         log_progress(f"Database connection error: {e}\n")
+        flush_log()
         return
 
+    # Set on the way out so an unused download (dialog cancelled, error,
+    # window closed) stops instead of tying up an EXECUTOR worker
+    cancel = Event()
+    parse_future = None
+
     try:
         # Check if book already exists with stored freqs
         book_row, stored_freqs = lookup_book_and_freqs(cur, gutID_int)
@@ -625,33 +906,28 @@ def click():
         # Fetch Gutenberg text
         url = make_gutenberg_link(gutID_int)
         log_progress(f"Fetching Gutenberg text from:\n{url}\n\n\n")
-
-        text, fetch_err = fetch_gutenberg_text(url)
-        if fetch_err:
+        flush_log()
+
+        # Download and parse in the background; only the header is needed here,
+        # so the rest of the book streams in while the author dialogs are open
+        header_future = Future()
+        parse_future = EXECUTOR.submit(_fetch_and_parse, url, header_future, cancel)
+        header = _wait_for_future(header_future)
+        if header is None:
+            _, fetch_err = _wait_for_future(parse_future)
             log_progress(fetch_err + "\n")
             return
 
         # Extract Title
-        raw_title = extract_title(text)
+        raw_title = extract_title(header)
         book_title = raw_title or "Unknown Title"
         log_progress(f"Detected Title: {book_title}\n\n")
 
-        # Insert book (if new)
-        if book_row is None:
-            try:
-                insert_book(cur, gutID_int, book_title)
-                con.commit()
-                log_progress(f"Inserted NEW book record:\n  ID={gutID_int}\n  Title='{book_title}'\n\n\n")
-            except sqlite3.IntegrityError:
-                log_progress(f"Book {gutID_int} already exists — continuing.\n")
-            except Exception as e:
-                log_progress(f"Error inserting book: {e}\n")
-                return
-
         # Extract Author Block
-        author_block = extract_author_block(text)
+        author_block = extract_author_block(header)
         log_progress("Extracted Author Block:\n")
         log_progress(f"{author_block}\n\n")
+        flush_log()
 
         # Ask user for number of authors
         num_authors = ask_green_integer(
@@ -667,92 +943,85 @@ def click():
 
         log_progress(f"User indicates {num_authors} author(s).\n\n")
 
-        # Collect authors from user & create author records
-        author_ids = []
-        for i in range(1, num_authors + 1):
-            # First name (optional)
-            first = ask_green_string(
-                window,
-                f"Author {i} — First/Middle Names",
-                "Enter FIRST & MIDDLE names (optional):\nEnter 'none' for single-name authors.",
-                allow_empty=True
-            )
-            if first is None:
-                log_progress("Author entry cancelled by user.\n")
-                return
-            first = first.strip()
-            if first == "" or first.lower() == "none":
-                first = None  # stored as NULL
-
-            # Last name (required)
-            last = ask_green_string(
-                window,
-                f"Author {i} — Last Name",
-                "Enter LAST name:\n(For single-name authors, enter the name here.)"
-            )
-            if last is None:
-                log_progress("Author entry cancelled by user.\n")
-                return
-            last = last.strip()
-            if last == "":
-                log_progress(f"ABORTED: Last name for Author {i} cannot be blank.\n")
-                return
-
-            author_id = get_or_create_author(cur, first, last)
-            author_ids.append(author_id)
-            log_progress(f"Author {i} recorded: {first or ''} {last} (id={author_id})\n")
-
-        log_progress("\nAll author records complete.\n\n\n")
-
-        # Insert relationships into bookAuthors
-        try:
-            for order, a_id in enumerate(author_ids, start=1):
-                insert_book_author_links(cur, gutID_int, author_ids)
-                log_progress(f"Linked Book {gutID_int} → Author {a_id} (order = {order})\n")
-            con.commit()
-            log_progress("\nAuthor linkage completed.\n\n\n")
-        except Exception as e:
-            log_progress(f"Error linking book and authors: {e}\n")
+        # Collect all authors from the user in one dialog
+        entered = ask_green_authors(window, num_authors)
+        if entered is None:
+            log_progress("Author entry cancelled by user.\n")
             return
 
-        refresh_dropdown()
-        gutenberg_id_var.set("")
-
-        # Parse text & load stopwords
-        parser = MyHTMLParser()
-        parser.feed(text.lower())
+        # Collect the parsed text (streamed in the background since the fetch)
+        parser, fetch_err = _wait_for_future(parse_future)
+        if fetch_err:
+            log_progress(fetch_err + "\n")
+            return
         log_progress("Text parsed. Extracted word tokens from Project Gutenberg source.\n\n")
+        flush_log()
 
-        stopwords = load_stopwords()
-        log_progress(f"Loaded {len(stopwords)} stopwords.\n\n")
+        log_progress(f"Loaded {len(STOPWORDS)} stopwords.\n\n")
 
-        full_counts = parser.frequency(5, stopwords=stopwords, top_k=None)
-        if not full_counts:
+        top10 = parser.frequency(5, top_k=10)
+        if not top10:
             log_progress("No valid tokens found after filtering.\n")
             return
 
-        # Store Top 10 frequencies
+        # Store book, authors, links and Top 10 frequencies in ONE transaction
+        # (a single commit; rolled back as a whole on any error)
         try:
-            sorted_rows = sorted(full_counts.items(), key=lambda x: x[1], reverse=True)
-            top10 = sorted_rows[:10]
-
-            log_progress("Storing Top 10 word frequencies...\n")
-            for word, count in top10:
+            with con:
+                # Insert book (if new)
+                if book_row is None:
+                    insert_book(cur, gutID_int, book_title)
+                    log_progress(f"Inserted NEW book record:\n  ID={gutID_int}\n  Title='{book_title}'\n\n\n")
+
+                # Create author records
+                author_ids = []
+                authors = []
+                author_cache = {}   # (first, last) → id, so repeated names skip the DB
+                for i, (first, last) in enumerate(entered, start=1):
+                    if first == "" or first.lower() == "none":
+                        first = None  # stored as NULL
+
+                    author_id = author_cache.get((first, last))
+                    if author_id is None:
+                        author_id = get_or_create_author(cur, first, last)
+                        author_cache[(first, last)] = author_id
+                    author_ids.append(author_id)
+                    authors.append((first, last))
+                    log_progress(f"Author {i} recorded: {first or ''} {last} (id={author_id})\n")
+
+                log_progress("\nAll author records complete.\n\n\n")
+
+                # Insert relationships into bookAuthors
+                insert_book_author_links(cur, gutID_int, author_ids)
+                log_progress("".join(
+                    f"Linked Book {gutID_int} → Author {a_id} (order = {order})\n"
+                    for order, a_id in enumerate(author_ids, start=1)
+                ))
+                log_progress("\nAuthor linkage completed.\n\n\n")
+
+                # Store Top 10 frequencies
+                log_progress("Storing Top 10 word frequencies...\n")
                 store_word_frequencies(cur, gutID_int, top10)
-                log_progress(f"  {word:<15} → {count}\n")
-            con.commit()
+                log_progress("".join(f"  {word:<15} → {count}\n" for word, count in top10))
 
         except Exception as e:
-            log_progress(f"Error saving word frequencies: {e}\n")
+            log_progress(f"Error saving book data (nothing was stored): {e}\n")
             return
 
-        # Display results
-        _, freq_rows = lookup_book_and_freqs(cur, gutID_int)
+        stored_title = book_row[1] if book_row else book_title
+        add_book_to_dropdown(gutID_int, stored_title, authors)
+        gutenberg_id_var.set("")
 
-        show_top10_from_db(freq_rows, gutID_int)
+        # Display results straight from memory; order ties by word as the
+        # stored lookup does, so a later re-display looks identical
+        show_top10_from_db(sorted(top10, key=lambda x: (-x[1], x[0])), gutID_int)
 
     finally:
-        con.close()
+        cancel.set()
+        if parse_future is not None:
+            parse_future.cancel()   # drop it if it never started
+        cur.close()
+        flush_log()
 
 # ---------------------------
 # Build UI (layout)
@@ -778,7 +1047,7 @@ Label(window,
 
 # Dropdown combobox with placeholder (row 3)
 ## Load book list from DB to populate dropdown
-book_list, id_map = load_book_list_from_db()
+book_list, id_list = load_book_list_from_db()
 
 ## format dropdown
 book_choice = StringVar(value="__ select a book __")
@@ -818,7 +1087,8 @@ bio_link.grid(row=6, column=0, pady=(20,0))   # Centered
 bio_link.bind("<Button-1>", lambda e: open_bio_shelf())
 
 # Buttons for SUBMIT & CLEAR (row 7)
-CustomButton(window, text="SUBMIT", width=6, command=click).grid(row=7, column=0, sticky=W, padx=(10,0), pady=(0,0))
+submit_button = CustomButton(window, text="SUBMIT", width=6, command=click)
+submit_button.grid(row=7, column=0, sticky=W, padx=(10,0), pady=(0,0))
 CustomButton(window, text="CLEAR", width=6, command=clear_fields).grid(row=7, column=0, sticky=E, padx=(0,10), pady=(0,0))
 
 # Progress log output label and text areas (rows 8-9)
@@ -852,6 +1122,7 @@ Label(window,
       bg="#C9F2CE", fg="#1F6B2D",
       font="noteworthy 20 bold").grid(row=13, column=0, sticky=W, padx=(10,0))
 CustomButton(window, text="EXIT", width=6, command=close_window).grid(row=14, column=0, sticky=W, padx=(10,0), pady=(5,0))
+window.protocol("WM_DELETE_WINDOW", close_window)   # window close button behaves like EXIT
 
 # Blank row (row 15)
 divider = Frame(window, bg="#C9F2CE")
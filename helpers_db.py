@@ -13,12 +13,21 @@ no printing or logging.
 
 Available functions
 -------------------
+- :func:`get_connection`  
+    Return the shared, lazily opened database connection.
+
+- :func:`close_connection`  
+    Close the shared connection (also registered with :mod:`atexit`).
+
 - :func:`ensure_tables_exist`  
     Create all required tables if they do not already exist.
 
 - :func:`insert_book`  
     Insert a book record unless it is already present.
 
+- :func:`insert_books`  
+    Insert many book records with a single ``executemany`` call.
+
 - :func:`get_or_create_author`  
     Look up an author by name or insert a new one if absent.
 
@@ -34,12 +43,18 @@ Available functions
 - :func:`get_book_authors`  
     Retrieve an ordered list of authors linked to a book.
 
+- :func:`get_book_author_names`  
+    Retrieve display-ready author names for a book, formatted in SQL.
+
 - :func:`store_word_frequencies`  
     Store (or update) the top word-frequency results for a book.
 
+- :func:`format_book_label`  
+    Build the cleaned dropdown label for a single book.
+
 - :func:`load_book_list_from_db`  
-    Construct a cleaned display list of books and build a mapping suitable
-    for GUI dropdowns.
+    Construct a cleaned display list of books and a parallel list of IDs
+    suitable for GUI dropdowns.
 
 Notes
 -----
@@ -54,10 +69,107 @@ CSM CIS 117 Final Project
 Date: November–December 2025
 """
 
+import atexit
+import re
 import sqlite3
+from itertools import groupby
 
 DB_PATH = "ProjGutBooks.db"
 
+# Connection tuning applied by ensure_tables_exist(). journal_mode persists in
+# the database file; the others are per-connection settings.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",   # 256 MB memory-mapped reads
+    "PRAGMA cache_size=-20000",     # ~20 MB page cache
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+_CON = None   # shared connection, created on first use by get_connection()
+
+# Leading article removed from titles for display ("A ", "An ", "The ")
+_LEADING_ART_RE = re.compile(r"^(?:a|an|the) ", re.IGNORECASE)
+
+# wordFreqs is keyed by (projGutID, word) and stored WITHOUT ROWID, so rows
+# live directly in the primary-key b-tree (one descent per lookup)
+_WORDFREQS_DDL = """
+    CREATE TABLE IF NOT EXISTS {name} (
+        projGutID INTEGER,
+        word TEXT,
+        word_count INTEGER,
+        PRIMARY KEY (projGutID, word),
+        FOREIGN KEY (projGutID) REFERENCES book(projGutID)
+    ) WITHOUT ROWID
+"""
+
+
+def _apply_pragmas(con):
+    """
+    Apply the application's performance PRAGMAs to a connection.
+
+    Parameters
+    ----------
+    con : sqlite3.Connection
+        Active database connection (must not be inside a transaction).
+    """
+    for pragma in _PRAGMAS:
+        con.execute(pragma)
+
+
+def get_connection():
+    """
+    Return the shared database connection, opening it on first use.
+
+    The connection is created once per process with
+    ``check_same_thread=False``, tuned and schema-checked via
+    :func:`ensure_tables_exist`, and then reused so SQLite's page cache and
+    memory map stay warm across calls.
+
+    Returns
+    -------
+    sqlite3.Connection
+        The shared connection to ``DB_PATH``.
+
+    Raises
+    ------
+    sqlite3.Error
+        If the database cannot be opened or its schema cannot be ensured.
+        Nothing is cached in that case, so a later call tries again.
+    """
+    global _CON
+    if _CON is None:
+        con = sqlite3.connect(DB_PATH, check_same_thread=False)
+        try:
+            ensure_tables_exist(con)
+        except Exception:
+            con.close()
+            raise
+        _CON = con
+    return _CON
+
+
+def close_connection():
+    """
+    Close the shared database connection if it is open.
+
+    Safe to call more than once; a later :func:`get_connection` call opens a
+    fresh connection. Registered with :mod:`atexit`. ``PRAGMA optimize`` is
+    run first so planner statistics stay current as the tables grow.
+    """
+    global _CON
+    if _CON is not None:
+        try:
+            _CON.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass  # statistics are an optimization only
+        _CON.close()
+        _CON = None
+
+
+atexit.register(close_connection)
+
 
 def ensure_tables_exist(con):
     """
@@ -71,13 +183,29 @@ def ensure_tables_exist(con):
     Notes
     -----
     This function is safe to call repeatedly. It silently ensures all required
-    tables exist but performs no logging. The schema contains:
+    tables exist but performs no logging. It also tunes the connection
+    (WAL journal, ``synchronous=NORMAL``, memory-mapped I/O, larger page
+    cache, in-memory temp storage). The schema contains:
 
     - ``author``: stores author names  
     - ``book``: stores Project Gutenberg books  
     - ``bookAuthors``: junction table linking books ↔ authors  
     - ``wordFreqs``: stored top word-frequency results  
+
+    Supporting indexes cover the hot lookups: authors of a book in author
+    order, authors by name (a UNIQUE ``(last, first)`` index, which also
+    lets :func:`get_or_create_author` rely on the constraint), and a book's
+    words by descending count (covering the top-k read in
+    :func:`lookup_book_and_freqs`, so no sort is needed).
+
+    ``wordFreqs`` is a ``WITHOUT ROWID`` table. A database created before
+    this layout has its ``wordFreqs`` rows copied into the new layout once.
+
+    ``ANALYZE`` is run the first time the schema is created (when no
+    ``sqlite_stat1`` table exists yet) so the query planner has statistics
+    for the indexes above.
     """
+    _apply_pragmas(con)
     cur = con.cursor()
 
     # author table
@@ -109,20 +237,68 @@ def ensure_tables_exist(con):
         )
     """)
 
-    # wordFreqs 
+    # wordFreqs (migrating an older rowid table first, if present)
+    _migrate_wordfreqs_without_rowid(cur)
+    cur.execute(_WORDFREQS_DDL.format(name="wordFreqs"))
+
+    # indexes for author lookups (by book in order, and by name)
     cur.execute("""
-        CREATE TABLE IF NOT EXISTS wordFreqs (
-            projGutID INTEGER,
-            word TEXT,
-            word_count INTEGER,
-            PRIMARY KEY (projGutID, word),
-            FOREIGN KEY (projGutID) REFERENCES book(projGutID)
-        )
+        CREATE INDEX IF NOT EXISTS idx_ba_pg
+        ON bookAuthors (projGutID, author_order)
+    """)
+    cur.execute("""
+        CREATE UNIQUE INDEX IF NOT EXISTS ix_author_last_first
+        ON author (last, first)
+    """)
+
+    # covering index for a book's top words by count
+    cur.execute("""
+        CREATE INDEX IF NOT EXISTS ix_wordfreqs_gut_count
+        ON wordFreqs (projGutID, word_count DESC)
     """)
 
+    # seed planner statistics once; PRAGMA optimize keeps them fresh on close
+    has_stats = cur.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+    ).fetchone()
+    if not has_stats:
+        cur.execute("ANALYZE")
+
     con.commit()
 
 
+def _migrate_wordfreqs_without_rowid(cur):
+    """
+    Rebuild an existing rowid ``wordFreqs`` table as ``WITHOUT ROWID``.
+
+    Parameters
+    ----------
+    cur : sqlite3.Cursor
+        Active database cursor.
+
+    Notes
+    -----
+    Does nothing if ``wordFreqs`` does not exist yet or already uses the new
+    layout. Otherwise the rows are copied into a new table, the old table is
+    dropped, and the new one is renamed into place. The caller commits.
+    """
+    cur.execute(
+        "SELECT sql FROM sqlite_master WHERE type='table' AND name='wordFreqs'"
+    )
+    row = cur.fetchone()
+    if row is None or "WITHOUT ROWID" in row[0].upper():
+        return
+
+    cur.execute("DROP TABLE IF EXISTS wordFreqs_new")
+    cur.execute(_WORDFREQS_DDL.format(name="wordFreqs_new"))
+    cur.execute("""
+        INSERT INTO wordFreqs_new (projGutID, word, word_count)
+        SELECT projGutID, word, word_count FROM wordFreqs
+    """)
+    cur.execute("DROP TABLE wordFreqs")
+    cur.execute("ALTER TABLE wordFreqs_new RENAME TO wordFreqs")
+
+
 def insert_book(cur, gutID_int, title):
     """
     Insert a book record if it does not already exist.
@@ -139,10 +315,32 @@ def insert_book(cur, gutID_int, title):
     Notes
     -----
     The insert uses ``INSERT OR IGNORE`` so existing records are preserved.
+    This is a single-row form of :func:`insert_books`.
     """
-    cur.execute(
+    insert_books(cur, [(gutID_int, title)])
+
+
+def insert_books(cur, rows):
+    """
+    Insert many book records, skipping any that already exist.
+
+    Parameters
+    ----------
+    cur : sqlite3.Cursor
+        Active database cursor.
+    rows : iterable of (int, str)
+        ``(projGutID, title)`` pairs.
+
+    Notes
+    -----
+    All rows are written with one ``executemany`` call using
+    ``INSERT OR IGNORE``. No commit is issued, so a caller ingesting many
+    books can wrap the call in a single transaction (e.g. ``with con:``) and
+    pay for one commit instead of one per book.
+    """
+    cur.executemany(
         "INSERT OR IGNORE INTO book (projGutID, title) VALUES (?, ?)",
-        (gutID_int, title)
+        rows
     )
 
 
@@ -166,25 +364,23 @@ def get_or_create_author(cur, first, last):
 
     Notes
     -----
-    Matching is exact on both ``first`` and ``last``.
-    If no match exists, a new row is inserted.
+    Matching is exact on both ``first`` and ``last``. Lookup and insert are a
+    single ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING`` statement backed
+    by the unique ``(last, first)`` index (requires SQLite 3.35+). As before,
+    a ``None`` first name never matches an existing row.
     """
     cur.execute(
-        "SELECT id FROM author WHERE first = ? AND last = ?",
-        (first, last)
-    )
-    row = cur.fetchone()
-    if row:
-        return row[0]
-
-    cur.execute(
-        "INSERT INTO author (first, last) VALUES (?, ?)",
+        """
+        INSERT INTO author (first, last) VALUES (?, ?)
+        ON CONFLICT (last, first) DO UPDATE SET last = excluded.last
+        RETURNING id
+        """,
         (first, last)
     )
-    return cur.lastrowid
+    return cur.fetchone()[0]
 
 
-def lookup_book_and_freqs(cur, gutID_int):
+def lookup_book_and_freqs(cur, gutID_int, limit=10):
     """
     Retrieve stored metadata and word-frequency results for a book.
 
@@ -194,26 +390,42 @@ def lookup_book_and_freqs(cur, gutID_int):
         Active database cursor.
     gutID_int : int
         Project Gutenberg numeric identifier.
+    limit : int, optional
+        Maximum number of frequency rows to return. Default is 10.
 
     Returns
     -------
     tuple
         ``(book_row, freq_rows)``  
         - ``book_row`` is ``(projGutID, title)`` or ``None`` if the book is absent.  
-        - ``freq_rows`` is a list of ``(word, count)`` pairs, or ``None`` if no
+        - ``freq_rows`` is a list of at most ``limit`` ``(word, count)`` pairs
+          in descending count order (ties by word), or ``None`` if no
           frequency data is stored.
+
+    Notes
+    -----
+    Ordering and truncation are done by SQLite, so callers need no sort.
+    Book and frequencies come back from one ``LEFT JOIN`` query; a book
+    without stored frequencies yields a single row with ``NULL`` word
+    columns.
     """
     cur.execute(
-        "SELECT projGutID, title FROM book WHERE projGutID=?",
-        (gutID_int,)
+        """
+        SELECT b.projGutID, b.title, wf.word, wf.word_count
+        FROM book b
+        LEFT JOIN wordFreqs wf ON wf.projGutID = b.projGutID
+        WHERE b.projGutID = ?
+        ORDER BY wf.word_count DESC, wf.word
+        LIMIT ?
+        """,
+        (gutID_int, limit)
     )
-    book = cur.fetchone()
+    rows = cur.fetchall()
+    if not rows:
+        return None, None
 
-    cur.execute(
-        "SELECT word, word_count FROM wordFreqs WHERE projGutID=?",
-        (gutID_int,)
-    )
-    freqs = cur.fetchall()
+    book = (rows[0][0], rows[0][1])
+    freqs = [(word, count) for _, _, word, count in rows if word is not None]
 
     return book, (freqs if freqs else None)
 
@@ -233,16 +445,20 @@ def insert_book_author_links(cur, gutID_int, author_ids):
 
     Notes
     -----
-    ``INSERT OR IGNORE`` prevents accidental duplicate associations.
-    """
-    for order, a_id in enumerate(author_ids, start=1):
-        cur.execute(
-            """
-            INSERT OR IGNORE INTO bookAuthors (projGutID, author_id, author_order)
-            VALUES (?, ?, ?)
-            """,
-            (gutID_int, a_id, order)
-        )
+    ``INSERT OR IGNORE`` prevents accidental duplicate associations. All links
+    are written with a single ``executemany`` call.
+    """
+    link_rows = [
+        (gutID_int, a_id, order)
+        for order, a_id in enumerate(author_ids, start=1)
+    ]
+    cur.executemany(
+        """
+        INSERT OR IGNORE INTO bookAuthors (projGutID, author_id, author_order)
+        VALUES (?, ?, ?)
+        """,
+        link_rows
+    )
 
 
 def get_book_title(cur, gutID_int):
@@ -295,6 +511,44 @@ def get_book_authors(cur, gutID_int):
     return cur.fetchall()
 
 
+def get_book_author_names(cur, gutID_int):
+    """
+    Retrieve display-ready author names for a given book.
+
+    Parameters
+    ----------
+    cur : sqlite3.Cursor
+        Active database cursor.
+    gutID_int : int
+        Project Gutenberg numeric identifier.
+
+    Returns
+    -------
+    list of str
+        Author names in author order, formatted as ``"First Last"``, or just
+        ``"Last"`` for mononym authors (``first`` missing, blank, ``"none"``,
+        or ``"null"``).
+
+    Notes
+    -----
+    Formatting is done by SQLite in the query itself, so no per-author
+    Python string handling is needed by the caller.
+    """
+    cur.execute("""
+        SELECT CASE
+                   WHEN a.first IS NULL
+                        OR LOWER(TRIM(a.first)) IN ('', 'none', 'null')
+                   THEN a.last
+                   ELSE a.first || ' ' || a.last
+               END
+        FROM bookAuthors ba
+        JOIN author a ON ba.author_id = a.id
+        WHERE ba.projGutID = ?
+        ORDER BY ba.author_order
+    """, (gutID_int,))
+    return [row[0] for row in cur.fetchall()]
+
+
 def store_word_frequencies(cur, gutID_int, top10):
     """
     Store the top word-frequency results for a book.
@@ -310,16 +564,52 @@ def store_word_frequencies(cur, gutID_int, top10):
 
     Notes
     -----
-    ``INSERT OR REPLACE`` ensures updates overwrite older values.
-    """
-    for word, count in top10:
-        cur.execute(
-            """
-            INSERT OR REPLACE INTO wordFreqs (projGutID, word, word_count)
-            VALUES (?, ?, ?)
-            """,
-            (gutID_int, word, count)
-        )
+    ``INSERT OR REPLACE`` ensures updates overwrite older values. All rows are
+    written with a single ``executemany`` call.
+    """
+    rows = [(gutID_int, word, count) for word, count in top10]
+    cur.executemany(
+        """
+        INSERT OR REPLACE INTO wordFreqs (projGutID, word, word_count)
+        VALUES (?, ?, ?)
+        """,
+        rows
+    )
+
+
+def format_book_label(title, authors):
+    """
+    Build the cleaned display label used for a book in the GUI dropdown.
+
+    Parameters
+    ----------
+    title : str
+        Stored title of the book.
+    authors : list of (str or None, str)
+        ``(first, last)`` tuples in author order; may be empty.
+
+    Returns
+    -------
+    str
+        ``"Cleaned Title (Lastname)"`` for one author,
+        ``"Cleaned Title (Lastname et al.)"`` for multiple authors,
+        or ``"Cleaned Title (Unknown Author)"`` when no author data exists.
+
+    Notes
+    -----
+    Leading articles (“A”, “An”, “The”) are removed *for display only*.
+    """
+    # Determine suffix for label
+    if not authors:
+        suffix = "Unknown Author"
+    else:
+        last = authors[0][1].strip()
+        suffix = last if len(authors) == 1 else f"{last} et al."
+
+    # Remove leading articles for display
+    clean_title = _LEADING_ART_RE.sub("", title.strip(), count=1)
+
+    return f"{clean_title} ({suffix})"
 
 
 def load_book_list_from_db():
@@ -329,73 +619,44 @@ def load_book_list_from_db():
     Returns
     -------
     tuple
-        ``(display_list, idmap)``  
-        - ``display_list`` : list of strings formatted as  
-          ``"Cleaned Title (Lastname)"`` for one author,  
-          ``"Cleaned Title (Lastname et al.)"`` for multiple authors,  
-          or ``"Cleaned Title (Unknown Author)"`` when no author data exists.  
-        - ``idmap`` : dict mapping each display label → ``projGutID``.
+        ``(display_list, id_list)``  
+        - ``display_list`` : list of labels built by
+          :func:`format_book_label`.  
+        - ``id_list`` : list of ``projGutID`` values aligned index-for-index
+          with ``display_list``.
 
     Notes
     -----
-    - Ensures the database schema exists before reading.
-    - Removes leading articles (“A”, “An”, “The”) *for display only*.
-    - Determines the first author's last name for label formatting.
+    - Reads through the shared connection from :func:`get_connection`, which
+      ensures the database schema exists; the connection is left open.
+    - Books and their authors are read with one ``LEFT JOIN`` query and
+      grouped per book in Python (no per-book author queries).
+    - Labels are formatted by :func:`format_book_label`.
     """
     try:
-        con = sqlite3.connect(DB_PATH)
-        cur = con.cursor()
-
-        ensure_tables_exist(con)
-
-        cur.execute("SELECT projGutID, title FROM book ORDER BY title;")
+        cur = get_connection().cursor()
+        cur.execute("""
+            SELECT b.projGutID, b.title, a.first, a.last
+            FROM book b
+            LEFT JOIN bookAuthors ba ON ba.projGutID = b.projGutID
+            LEFT JOIN author a ON a.id = ba.author_id
+            ORDER BY b.title, b.projGutID, ba.author_order
+        """)
         rows = cur.fetchall()
+        cur.close()
 
     except Exception:
-        return [], {}
-    finally:
-        try:
-            con.close()
-        except Exception:
-            pass
+        return [], []
 
     display = []
-    idmap = {}
+    id_list = []
 
-    for bid, title in rows:
-        # Fetch authors for each book
-        try:
-            con = sqlite3.connect(DB_PATH)
-            cur = con.cursor()
-            cur.execute("""
-                SELECT a.first, a.last
-                FROM bookAuthors ba
-                JOIN author a ON ba.author_id = a.id
-                WHERE ba.projGutID = ?
-                ORDER BY ba.author_order ASC
-            """, (bid,))
-            authors = cur.fetchall()
-            con.close()
-        except Exception:
-            authors = []
-
-        # Determine suffix for label
-        if not authors:
-            suffix = "Unknown Author"
-        else:
-            last = authors[0][1].strip()
-            suffix = last if len(authors) == 1 else f"{last} et al."
-
-        # Remove leading articles for display
-        clean_title = title.strip()
-        low = clean_title.lower()
-        for art in ("a ", "an ", "the "):
-            if low.startswith(art):
-                clean_title = clean_title[len(art):]
-                break
-
-        label = f"{clean_title} ({suffix})"
+    for (bid, title), group in groupby(rows, key=lambda r: (r[0], r[1])):
+        # Books without authors come back as a single row of NULLs
+        authors = [(first, last) for _, _, first, last in group if last is not None]
+
+        label = format_book_label(title, authors)
         display.append(label)
-        idmap[label] = bid
+        id_list.append(bid)
 
-    return display, idmap
+    return display, id_list
@@ -17,7 +17,11 @@ Available functions and classes
     Construct the canonical URL for a Project Gutenberg plain-text file.
 
 - :func:`fetch_gutenberg_text`  
-    Download ebook text with simple error handling.
+    Download ebook text (revalidated against an on-disk cache) with simple
+    error handling.
+
+- :func:`feed_gutenberg_text`  
+    Stream ebook text straight into a parser, capturing only the header.
 
 - :func:`extract_title`  
     Retrieve the book title from standard Gutenberg metadata.
@@ -28,9 +32,13 @@ Available functions and classes
 - :func:`load_stopwords`  
     Load stopwords from a UTF-8 text file.
 
-- :class:`MyHTMLParser`  
-    A lightweight HTMLParser subclass for tokenizing words and computing
-    frequency counts.
+- :func:`tokenize_and_count`  
+    Count the words of a complete text in a single regex pass.
+
+- :class:`WordCounter`  
+    A lightweight plain-text tokenizer for counting words and computing
+    frequency counts (also available under its former name
+    ``MyHTMLParser``).
 
 Notes
 -----
@@ -44,15 +52,74 @@ CSM CIS 117 Final Project
 Date: November–December 2025
 """
 
+import functools
+import hashlib
+import heapq
+import json
+import os
 import re
 import requests
-from html.parser import HTMLParser
+from operator import itemgetter
 from collections import Counter
 import string
+import sys
 
 STOPWORDS_PATH = "stopwords.txt"
 
+# Downloaded texts are kept here with their ETag/Last-Modified validators, so
+# a repeat download is a conditional GET answered by 304 Not Modified.
+TEXT_CACHE_DIR = "gutenberg_cache"
+
+# Characters of the ebook start kept as the "header" by feed_gutenberg_text();
+# Gutenberg's Title:/Author: metadata lives well inside this span.
+HEADER_CHARS = 32768
+
+# Metadata searches look at this many leading characters first and only scan
+# the whole text when nothing is found there.
+_METADATA_SCAN_CHARS = 8192
+
+_TITLE_RE = re.compile(r"(?im)^[^\S\n]*title:(.*)$")
+_AUTHOR_RE = re.compile(r"(?im)^[ \t]*author:\s*")
+_HEADER_BODY = r"[ \t]*[A-Za-z][A-Za-z \-]*:\s"
+_NEXT_HEADER_RE = re.compile(r"(?m)^" + _HEADER_BODY)
+_HEADER_AT_RE = re.compile(_HEADER_BODY)
 
+def _numeric_non_letter_class():
+    """
+    Return regex class contents for every numeric character that is not a
+    letter (``ch.isnumeric() and not ch.isalpha()``), as escaped ranges.
+
+    Removing these (and ``\\d`` and ``_``) from ``\\w`` leaves exactly the
+    characters for which :meth:`str.isalpha` is true.
+    """
+    points = [i for i in range(sys.maxunicode + 1)
+              if chr(i).isnumeric() and not chr(i).isalpha()]
+    parts = []
+    start = prev = points[0]
+    for i in points[1:] + [None]:
+        if i is not None and i == prev + 1:
+            prev = i
+            continue
+        parts.append(re.escape(chr(start)) if start == prev
+                     else f"{re.escape(chr(start))}-{re.escape(chr(prev))}")
+        if i is not None:
+            start = prev = i
+    return "".join(parts)
+
+# One whitespace-delimited token: optional ASCII punctuation on either side
+# around a word of letters, with apostrophes/hyphens allowed only inside.
+# Tokens containing digits or any other character do not match at all.
+# A "letter" is a word character that is not a digit, underscore, or other
+# numeric character (superscripts, fractions, roman numerals, number signs),
+# i.e. exactly a character for which str.isalpha() is true.
+_PUNCT = re.escape(string.punctuation)
+_LETTER = rf"[^\W\d_{_numeric_non_letter_class()}]"
+_TOKEN_RE = re.compile(
+    rf"(?<!\S)[{_PUNCT}]*({_LETTER}(?:[-']*{_LETTER})*)[{_PUNCT}]*(?!\S)"
+)
+
+
+@functools.lru_cache(maxsize=128)
 def make_gutenberg_link(book_id):
     """
     Construct the canonical Project Gutenberg text URL for a book.
@@ -71,18 +138,26 @@ def make_gutenberg_link(book_id):
     str
         Fully formed URL pointing to the plain-text ``.txt`` file for the
         specified book.
+
+    Notes
+    -----
+    Results are cached per ``book_id``; repeated lookups of the same book
+    return the stored URL.
     """
     book_id = str(book_id).lower().replace("pg", "").strip()
     return f"https://www.gutenberg.org/cache/epub/{book_id}/pg{book_id}.txt"
 
-def fetch_gutenberg_text(url, timeout=20):
+def fetch_gutenberg_text(url, timeout=20, chunk_size=65536):
     """
     Retrieve plain-text book content from a Project Gutenberg URL.
 
     A simple wrapper around :func:`requests.get` that provides error handling
     suitable for user-facing applications. Network failures, HTTP errors, and
     unexpected exceptions are returned as a human-readable message rather than
-    raised.
+    raised. The body is streamed and decoded chunk by chunk, so the raw bytes
+    of the whole book are never buffered alongside the decoded text. Use
+    :func:`feed_gutenberg_text` to tokenize while downloading instead.
+    Downloads go through the on-disk cache in ``TEXT_CACHE_DIR``.
 
     Parameters
     ----------
@@ -90,6 +165,8 @@ def fetch_gutenberg_text(url, timeout=20):
         Direct URL to a Gutenberg ``.txt`` file.
     timeout : int, optional
         Connection timeout in seconds. Default is 20.
+    chunk_size : int, optional
+        Download chunk size in bytes. Default is 65536.
 
     Returns
     -------
@@ -101,19 +178,229 @@ def fetch_gutenberg_text(url, timeout=20):
           message suitable for display in the GUI.
     """
     try:
-        resp = requests.get(url, timeout=timeout)
-        resp.raise_for_status()
-        return resp.text, None
+        return "".join(_iter_gutenberg_text(url, timeout, chunk_size)), None
     except Exception as e:
         return None, f"Error fetching Gutenberg text: {e}"
 
+def feed_gutenberg_text(url, parser, on_header=None, header_chars=HEADER_CHARS,
+                        timeout=20, chunk_size=65536, cancel=None):
+    """
+    Download a Gutenberg text and feed it to a parser chunk by chunk.
+
+    The response is streamed (``stream=True``) and each decoded chunk is
+    handed to ``parser.feed`` as it arrives, so tokenization overlaps the
+    download and the full book is never held as one string. Only the first
+    ``header_chars`` characters are kept, for metadata extraction with
+    :func:`extract_title` and :func:`extract_author_block`.
+
+    Parameters
+    ----------
+    url : str
+        Direct URL to a Gutenberg ``.txt`` file.
+    parser : WordCounter
+        Counter receiving the text via ``feed``.
+    on_header : callable or None, optional
+        Called once with the header text as soon as it is complete (or when
+        a shorter text has been fully downloaded), while the rest of the
+        book is still being fed. Not called if the download fails first.
+    header_chars : int, optional
+        Number of leading characters kept as the header.
+    timeout : int, optional
+        Connection timeout in seconds. Default is 20.
+    chunk_size : int, optional
+        Download chunk size in bytes. Default is 65536.
+    cancel : threading.Event or None, optional
+        Checked between chunks; once set, the download is abandoned and an
+        error message is returned.
+
+    Returns
+    -------
+    tuple
+        ``(header, error_message)``  
+        - ``header`` is the leading text of the book (possibly partial if
+          the download failed).  
+        - ``error_message`` is ``None`` on success, otherwise a descriptive  
+          message suitable for display in the GUI.
+
+    Notes
+    -----
+    A chunk may end in the middle of a word, so the trailing partial token
+    of each chunk is carried over and fed together with the next chunk.
+    Downloads go through the on-disk cache in ``TEXT_CACHE_DIR``; a cached
+    book that is still current is fed from disk.
+    """
+    header_parts = []
+    header_len = 0
+    header_sent = False
+    carry = ""
+    chunks = _iter_gutenberg_text(url, timeout, chunk_size)
+    try:
+        for chunk in chunks:
+            if cancel is not None and cancel.is_set():
+                chunks.close()   # drops the connection and any partial cache file
+                return "".join(header_parts)[:header_chars], "Download cancelled."
+            if header_len < header_chars:
+                header_parts.append(chunk)
+                header_len += len(chunk)
+                if header_len >= header_chars and on_header is not None:
+                    on_header("".join(header_parts)[:header_chars])
+                    header_sent = True
+
+            # Hold back the (possibly incomplete) last token
+            buf = carry + chunk
+            cut = len(buf)
+            while cut and not buf[cut - 1].isspace():
+                cut -= 1
+            parser.feed(buf[:cut])
+            carry = buf[cut:]
+
+        parser.feed(carry)
+    except Exception as e:
+        return "".join(header_parts)[:header_chars], f"Error fetching Gutenberg text: {e}"
+
+    header = "".join(header_parts)[:header_chars]
+    if not header_sent and on_header is not None:
+        on_header(header)
+    return header, None
+
+def _cache_paths(url):
+    """
+    Return the ``(text_path, meta_path)`` cache files for ``url``.
+    """
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    base = os.path.join(TEXT_CACHE_DIR, key)
+    return base + ".txt", base + ".json"
+
+def _iter_gutenberg_text(url, timeout, chunk_size):
+    """
+    Yield the decoded text of ``url`` in chunks, using the on-disk cache.
+
+    If a cached copy exists, its ``ETag`` / ``Last-Modified`` validators are
+    sent as ``If-None-Match`` / ``If-Modified-Since``. A ``304`` response is
+    served from the cached file; otherwise the body is streamed from the
+    network and written to the cache as it is yielded. The cache only
+    replaces the old copy once the whole body has arrived. Failure to write
+    the cache never fails the download, and a cached copy that cannot be
+    read on a ``304`` is replaced by a full download. Cache files are
+    opened with ``newline=""`` so cached text is returned exactly as it
+    was downloaded (``\r\n`` line endings included).
+
+    Raises
+    ------
+    Exception
+        Any network or HTTP error from :mod:`requests`.
+    """
+    text_path, meta_path = _cache_paths(url)
+    headers = {}
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if os.path.exists(text_path):
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+    except (OSError, ValueError):
+        pass
+
+    resp = requests.get(url, timeout=timeout, stream=True, headers=headers)
+    if resp.status_code == 304 and headers:
+        resp.close()
+        try:
+            cached = open(text_path, "r", encoding="utf-8", newline="")
+        except OSError:
+            cached = None
+        if cached is not None:
+            with cached:
+                while True:
+                    chunk = cached.read(chunk_size)
+                    if not chunk:
+                        return
+                    yield chunk
+        # cached copy unreadable: download the full body again
+        resp = requests.get(url, timeout=timeout, stream=True)
+
+    with resp:
+        resp.raise_for_status()
+        if resp.encoding is None:
+            resp.encoding = "utf-8"
+        meta = {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }
+
+        # Only cache responses that can be revalidated later
+        part_path = text_path + ".part"
+        out = None
+        if meta["etag"] or meta["last_modified"]:
+            try:
+                os.makedirs(TEXT_CACHE_DIR, exist_ok=True)
+                out = open(part_path, "w", encoding="utf-8", newline="")
+            except OSError:
+                out = None
+
+        cache_ok = out is not None
+        complete = False
+        try:
+            for chunk in resp.iter_content(chunk_size=chunk_size, decode_unicode=True):
+                if not chunk:
+                    continue
+                if cache_ok:
+                    try:
+                        out.write(chunk)
+                    except OSError:
+                        cache_ok = False
+                yield chunk
+            complete = True
+        finally:
+            if out is not None:
+                try:
+                    out.close()
+                    if complete and cache_ok:
+                        # drop the old validators before the text they describe
+                        if os.path.exists(meta_path):
+                            os.remove(meta_path)
+                        os.replace(part_path, text_path)
+                        with open(meta_path, "w", encoding="utf-8") as f:
+                            json.dump(meta, f)
+                    else:
+                        os.remove(part_path)
+                except OSError:
+                    pass
+
+def _search_head(pattern, text, limit=_METADATA_SCAN_CHARS):
+    """
+    Search the first ``limit`` characters of ``text``, then all of it.
+
+    Parameters
+    ----------
+    pattern : re.Pattern
+        Compiled pattern to search for.
+    text : str
+        Text to search.
+    limit : int, optional
+        Number of leading characters searched first.
+
+    Returns
+    -------
+    re.Match or None
+        The first match in ``text``. A match touching the ``limit`` boundary
+        (which may have been cut short) is redone on the full text.
+    """
+    m = pattern.search(text, 0, limit)
+    if m is None or (m.end() == limit and limit < len(text)):
+        m = pattern.search(text)
+    return m
+
 def extract_title(text):
     """
     Extract the book title from Gutenberg header metadata.
 
-    The function scans the text line-by-line for the first line beginning with
-    ``"Title:"`` (case-insensitive) and returns the portion following the colon.
-    Only the first occurrence is considered.
+    The function finds the first line beginning with ``"Title:"``
+    (case-insensitive, leading whitespace ignored) and returns the portion
+    following the colon. Only the first occurrence is considered. The search
+    uses a precompiled regex over the start of the text, where Gutenberg
+    metadata lives, and scans further only if no title line is found there.
 
     Parameters
     ----------
@@ -126,11 +413,8 @@ def extract_title(text):
         The extracted title, or ``None`` if no recognizable ``"Title:"`` header
         is present.
     """
-    for line in text.splitlines():
-        low = line.lower().strip()
-        if low.startswith("title:"):
-            return line.split(":", 1)[1].strip()
-    return None
+    m = _search_head(_TITLE_RE, text)
+    return m.group(1).strip() if m else None
 
 
 def extract_author_block(text):
@@ -139,7 +423,8 @@ def extract_author_block(text):
 
     Behavior
     --------
-    1. Search for the first ``"Author:"`` header (case-insensitive).  
+    1. Search for the first ``"Author:"`` header (case-insensitive), looking
+       at the start of the text before scanning all of it.  
     2. After locating this header, look ahead for the next metadata-style
        header of the form  
        ``<letters and spaces>:``,  
@@ -162,20 +447,20 @@ def extract_author_block(text):
         The extracted author metadata block beginning with ``"Author:"``,
         or ``None`` if no such header is present.
     """
-    m = re.search(r'(?im)^[ \t]*author:\s*', text)
+    m = _search_head(_AUTHOR_RE, text)
     if not m:
         return None
 
     start_idx = m.start()
 
     # Look for next metadata header (e.g. "Release Date:", "Language:")
-    next_header = re.search(
-        r'(?m)^[ \t]*[A-Za-z][A-Za-z \-]*:\s',
-        text[m.end():]
-    )
+    # (searched in place from m.end(), which also counts as a line start,
+    # so the rest of the book is never copied)
+    next_header = (_HEADER_AT_RE.match(text, m.end())
+                   or _NEXT_HEADER_RE.search(text, m.end()))
 
     if next_header:
-        return text[start_idx:m.end() + next_header.start()].rstrip()
+        return text[start_idx:next_header.start()].rstrip()
 
     # Fall back to finding the end of the block as the next blank line
     blank = text.find("\n\n", m.end())
@@ -185,11 +470,13 @@ def extract_author_block(text):
     # Or return all text from 'Author:' onward
     return text[start_idx:].rstrip()
 
+@functools.lru_cache(maxsize=4)
 def load_stopwords(filepath=STOPWORDS_PATH):
     """
     Load stopwords from a UTF-8 text file, one word per line.
 
     Blank lines are ignored. All stopwords are normalized to lowercase.
+    Results are cached per ``filepath``, so repeated calls do no file I/O.
 
     Parameters
     ----------
@@ -199,64 +486,106 @@ def load_stopwords(filepath=STOPWORDS_PATH):
 
     Returns
     -------
-    set of str
-        A set of lowercase stopwords. If the file cannot be read (e.g. missing
-        or unreadable), an empty set is returned.
+    frozenset of str
+        An immutable set of lowercase stopwords, suitable for loading once and
+        reusing across many books. If the file cannot be read (e.g. missing
+        or unreadable), an empty frozenset is returned.
     """
     try:
         with open(filepath, "r", encoding="utf-8") as f:
-            return {line.strip().lower() for line in f if line.strip()}
+            return frozenset(f.read().lower().split())
     except Exception:
-        return set()
+        return frozenset()
+
+def tokenize_and_count(text, stopwords=None):
+    """
+    Count the words of a complete text in a single regex pass.
+
+    A convenience wrapper around :class:`WordCounter` for text already held
+    in memory (e.g. from :func:`fetch_gutenberg_text`): the whole text is
+    fed in one call, so it is lowercased once and tokenized with a single
+    ``findall``.
+
+    Parameters
+    ----------
+    text : str
+        Text to tokenize.
+    stopwords : iterable of str, optional
+        Words to exclude from the counts. Default is no stopwords.
+
+    Returns
+    -------
+    collections.Counter
+        Mapping of ``word → count``, in first-seen order.
+    """
+    counter = WordCounter(stopwords)
+    counter.feed(text)
+    return counter._counts
 
-class MyHTMLParser(HTMLParser):
+class WordCounter:
     """
-    Lightweight tokenizer for Gutenberg text based on :class:`HTMLParser`.
+    Lightweight tokenizer and word counter for Gutenberg plain text.
 
-    The parser extracts word-like tokens from raw text. Punctuation is stripped,
-    digits are excluded, and alphabetic words containing internal hyphens or
-    apostrophes are permitted. Cleaned tokens are stored internally for later
-    frequency computation.
+    The counter extracts word-like tokens from raw text. Punctuation is
+    stripped, digits are excluded, and alphabetic words containing internal
+    hyphens or apostrophes are permitted. Cleaned tokens are counted as they
+    arrive, so no per-token list is kept for later frequency computation.
+    Stopwords given to the constructor are dropped at ingest and never
+    occupy the counter.
+
+    Parameters
+    ----------
+    stopwords : iterable of str, optional
+        Words to exclude from the counts. Default is no stopwords.
 
     Notes
     -----
-    This class does not attempt to interpret HTML structure; it simply uses
-    :class:`HTMLParser` to receive text segments and tokenize them.
+    Gutenberg ``.txt`` files are plain text, so text is tokenized directly
+    with a regex; no HTML tag or entity scanning is performed. Text may be
+    fed in several chunks as long as chunks do not split a word.
 
     Methods
     -------
-    handle_data(data)
+    feed(data)
         Tokenize and accumulate cleaned words from a text segment.
     frequency(n, stopwords=None, top_k=None)
-        Compute filtered word frequencies from accumulated tokens.
+        Compute filtered word frequencies (or the ``top_k`` pairs) from
+        accumulated tokens.
     """
-    def __init__(self):
-        super().__init__()
-        self._words = []
-       
-    def handle_data(self, data):
+    def __init__(self, stopwords=None):
+        self._counts = Counter()
+        self._stopwords = frozenset(stopwords) if stopwords else frozenset()
+
+    def feed(self, data):
         """
-        Tokenize a chunk of text delivered by :class:`HTMLParser`.
+        Tokenize a chunk of text and add its words to the counts.
 
-        Processing steps:
+        Processing steps (a single pass of the precompiled ``_TOKEN_RE``
+        over the lowercased chunk; see the note below for ``İ``):
         - Split on whitespace.
         - Strip leading and trailing punctuation.
         - Exclude tokens containing digits.
         - Allow alphabetic words with internal apostrophes or hyphens.
-        - Normalize to lowercase and append to the internal token list.
+        - Add the lowercase words to the running word counts.
+        - Drop the constructor's stopwords from the counts.
+
+        Notes
+        -----
+        ``İ`` (U+0130) is the only letter whose lowercase form contains a
+        non-letter (``i`` + combining dot U+0307), so lowercasing first would
+        reject words such as ``"İstanbul"``. Chunks containing it are matched
+        in their original case and the tokens lowercased afterwards.
         """
-        for token in data.split():
-            cleaned = token.strip(string.punctuation)
-            if not cleaned:
-                continue
-            # skip words containing digits
-            if any(ch.isdigit() for ch in cleaned):
-                continue
-
-            # allow alphabetic words with '-' or apostrophes
-            alphabetic = cleaned.replace("-", "").replace("'", "").isalpha()
-            if alphabetic:
-                self._words.append(cleaned.lower())
+        counts = self._counts
+        if "\u0130" in data:
+            counts.update(map(str.lower, _TOKEN_RE.findall(data)))
+        else:
+            counts.update(_TOKEN_RE.findall(data.lower()))
+        # Probing the (small) stopword set keeps the C-level counting path;
+        # a stopword that is removed and re-added is never reported, so the
+        # first-seen order of the remaining words is unchanged.
+        for w in self._stopwords:
+            counts.pop(w, None)
 
     def frequency(self, n, stopwords=None, top_k=None):
         """
@@ -270,30 +599,35 @@ class MyHTMLParser(HTMLParser):
         n : int
             Minimum frequency threshold for a word to be included.
         stopwords : set of str, optional
-            Set of words to exclude from the results. Default is an empty set.
+            Additional words to exclude from the results, on top of those
+            already dropped at ingest. Default is an empty set.
         top_k : int or None, optional
             If provided, return only the ``top_k`` most frequent items,
-            sorted by descending frequency.
+            sorted by descending frequency. Selection uses a heap
+            (``O(V log top_k)``) rather than sorting the whole vocabulary.
 
         Returns
         -------
-        dict
+        dict or list of tuple
             Mapping of ``word → count`` that satisfies the threshold and
-            filtering conditions. When ``top_k`` is supplied, the returned
-            dictionary contains at most ``top_k`` items, ordered by decreasing
-            frequency.
+            filtering conditions. When ``top_k`` is supplied, a list of at
+            most ``top_k`` ``(word, count)`` pairs is returned instead,
+            ordered by decreasing frequency (like ``Counter.most_common``).
         """
-        if stopwords is None:
-            stopwords = set()
-
-        counts = Counter(self._words)
-        filtered = {
-            w: c for w, c in counts.items()
-            if c >= n and w not in stopwords
-        }
+        # Copy the counts (order preserved) and delete the few stopwords
+        # present, rather than testing every word against the stopwords
+        filtered = dict(self._counts)
+        if stopwords:
+            for w in stopwords:
+                filtered.pop(w, None)
+        if n > 1:
+            filtered = {w: c for w, c in filtered.items() if c >= n}
 
         if top_k:
-            top_items = sorted(filtered.items(), key=lambda x: x[1], reverse=True)
-            return dict(top_items[:top_k])
+            return heapq.nlargest(top_k, filtered.items(), key=itemgetter(1))
 
         return filtered
+
+
+# Former name, from when the class was built on html.parser.HTMLParser
+MyHTMLParser = WordCounter